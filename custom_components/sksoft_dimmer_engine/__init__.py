@@ -7,9 +7,10 @@ for one or more Light entities, running a single shared async loop.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import math
-from time import monotonic
+from time import monotonic, time
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
@@ -55,17 +56,6 @@ from .const import (
     PHASE_MODE_ABSOLUTE,
     PHASE_MODE_SYNC_TO_CURRENT,
     PHASE_MODES,
-    REG_MAX_B,
-    REG_MAX_CT,
-    REG_MIN_B,
-    REG_MIN_CT,
-    REG_MIN_DELTA,
-    REG_PERIOD,
-    REG_PHASE_MODE,
-    REG_PHASE_OFFSET,
-    REG_STARTED_AT_TS,
-    REG_SYNC_GROUP,
-    REG_TICK,
     SERVICE_START,
     SERVICE_START_CCW,
     SERVICE_STATUS,
@@ -73,8 +63,9 @@ from .const import (
     SERVICE_STOP_ALL,
     SERVICE_STOP_ALL_CCW,
     SERVICE_STOP_CCW,
+    STATE_RESYNC_INTERVAL_S,
 )
-from .storage import CCWCycleStore, DimmerEngineStore
+from .storage import CCWCycleEntry, CCWCycleStore, DimmerEngineStore, DimmerEntry
 
 if TYPE_CHECKING:
     pass
@@ -101,8 +92,12 @@ SERVICE_START_SCHEMA = vol.All(
     vol.Schema(
         {
             vol.Required(ATTR_LIGHTS): cv.entity_ids,
-            vol.Optional(ATTR_PERIOD_S, default=DEFAULT_PERIOD_S): vol.Coerce(float),
-            vol.Optional(ATTR_TICK_S, default=DEFAULT_TICK_S): vol.Coerce(float),
+            vol.Optional(ATTR_PERIOD_S, default=DEFAULT_PERIOD_S): vol.All(
+                vol.Coerce(float), vol.Range(min=0, min_included=False)
+            ),
+            vol.Optional(ATTR_TICK_S, default=DEFAULT_TICK_S): vol.All(
+                vol.Coerce(float), vol.Range(min=0, min_included=False)
+            ),
             vol.Optional(ATTR_MIN_BRIGHTNESS, default=DEFAULT_MIN_BRIGHTNESS): vol.All(
                 vol.Coerce(int), vol.Range(min=1, max=255)
             ),
@@ -149,8 +144,12 @@ SERVICE_START_CCW_SCHEMA = vol.All(
     vol.Schema(
         {
             vol.Required(ATTR_LIGHTS): cv.entity_ids,
-            vol.Optional(ATTR_PERIOD_S, default=DEFAULT_PERIOD_S): vol.Coerce(float),
-            vol.Optional(ATTR_TICK_S, default=DEFAULT_TICK_S): vol.Coerce(float),
+            vol.Optional(ATTR_PERIOD_S, default=DEFAULT_PERIOD_S): vol.All(
+                vol.Coerce(float), vol.Range(min=0, min_included=False)
+            ),
+            vol.Optional(ATTR_TICK_S, default=DEFAULT_TICK_S): vol.All(
+                vol.Coerce(float), vol.Range(min=0, min_included=False)
+            ),
             vol.Optional(ATTR_MIN_COLOR_TEMP, default=DEFAULT_MIN_COLOR_TEMP): vol.All(
                 vol.Coerce(int), vol.Range(min=1000, max=10000)
             ),
@@ -173,54 +172,164 @@ SERVICE_START_CCW_SCHEMA = vol.All(
 )
 
 
+def _compute_phases(
+    now: float,
+    due: list[int],
+    started_at: list[float],
+    omegas: list[float],
+    phase_offsets: list[float],
+) -> list[float]:
+    """Compute the sine phase of the due lights in one pass.
+
+    All phase modes use the same formula: phase = time_phase + offset
+    The difference is how the offset was computed when the light was registered:
+    - sync_to_current: offset computed from current value using asin
+    - absolute: offset provided directly by user
+    - relative: offset provided by user, added to time-based phase
+    """
+    return [(now - started_at[i]) * omegas[i] + phase_offsets[i] for i in due]
+
+
+def _compute_values(
+    due: list[int],
+    phases: list[float],
+    mids: list[float],
+    amps: list[float],
+) -> list[float]:
+    """Compute the unrounded sine-wave value of the due lights."""
+    sin = math.sin
+    return [mids[i] + amps[i] * sin(phase) for i, phase in zip(due, phases)]
+
+
+def _compute_targets(
+    due: list[int],
+    values: list[float],
+    lows: list[int],
+    highs: list[int],
+) -> list[int]:
+    """Round the due lights' sine-wave values, clamped to their range."""
+    return [
+        max(lows[i], min(highs[i], round(value))) for i, value in zip(due, values)
+    ]
+
+
+def _compute_wait(
+    phase: float, omega: float, step: float, min_tick: float
+) -> float:
+    """Compute how long a light's target can be left alone.
+
+    step is how far, in sine units (value / amp), the unrounded value can still
+    move before its rounded target may be min_delta away from the last value.
+    Within a phase advance x, sin moves by at most |cos(phase)| * x + x**2 / 2,
+    so solving that for step gives a wait in which the target cannot get that
+    far. It is first order on the slopes and bounded by the curvature near a
+    peak. The result is never below min_tick nor above the state resync
+    interval.
+    """
+    if step <= 0:
+        return min_tick
+    slope = abs(math.cos(phase))
+    wait = 2 * step / (omega * (math.sqrt(slope * slope + 2 * step) + slope))
+    return max(min_tick, min(wait, STATE_RESYNC_INTERVAL_S))
+
+
 class DimmerEngine:
     """Class to manage the dimmer engine loop and registry."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the dimmer engine."""
         self.hass = hass
-        self._registry: dict[str, dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
+        self._registry: dict[str, DimmerEntry] = {}
         self._task: asyncio.Task | None = None
         self._store = DimmerEngineStore(hass)
         self._running = False
+        # Offset from the monotonic clock to the wall clock, captured once so
+        # persisted wall-clock start times map onto a stable monotonic base
+        self._wall_offset = time() - monotonic()
+
+        # Hot per-light fields kept as parallel arrays (structure of arrays) so
+        # a tick computes every target in one pass without dict lookups
+        self._entity_ids: list[str] = []
+        self._ticks: list[float] = []
+        self._min_b: list[int] = []
+        self._max_b: list[int] = []
+        # Per-light constants derived once at registration time: angular
+        # frequency (2*pi/period), sine midpoint and amplitude
+        self._omegas: list[float] = []
+        self._mids: list[float] = []
+        self._amps: list[float] = []
+        self._phase_offsets: list[float] = []
+        self._min_deltas: list[int] = []
+        self._started_at: list[float] = []
+        # Last value sent to (or read from) each light, and when its state is
+        # next re-read even if the target has not moved
+        self._last_sent: list[int | None] = []
+        self._resync_at: list[float] = []
+        # Time each light is next due to be evaluated
+        self._next_update: list[float] = []
+        # Set when the registry changes to wake the loop early
+        self._wakeup = asyncio.Event()
+        # Minimum tick interval across all registered lights
+        self._min_tick = DEFAULT_TICK_S
 
     async def async_load(self) -> None:
         """Load registry from storage and start loop if needed."""
-        async with self._lock:
-            self._registry = await self._store.async_load()
-            if self._registry:
-                LOGGER.info(
-                    "Restored %d lights from storage: %s",
-                    len(self._registry),
-                    list(self._registry.keys()),
-                )
-                self._ensure_loop_running()
+        registry = await self._store.async_load()
+        # Entries saved before the period and tick were validated may have no
+        # angular frequency or keep the loop permanently due; drop them rather
+        # than failing setup or spinning
+        invalid = [
+            entity_id
+            for entity_id, entry in registry.items()
+            if entry.period <= 0 or entry.tick <= 0
+        ]
+        if invalid:
+            LOGGER.warning(
+                "Dropping lights with a non-positive period or tick from storage: %s",
+                invalid,
+            )
+            registry = {
+                entity_id: entry
+                for entity_id, entry in registry.items()
+                if entry.period > 0 and entry.tick > 0
+            }
+        self._registry = registry
+        self._rescan_min_tick()
+        self._rebuild_arrays()
+        if invalid:
+            self.async_schedule_save()
+        if self._registry:
+            LOGGER.info("Restored %d lights from storage", len(self._registry))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Restored lights: %s", list(self._registry))
+            self._ensure_loop_running()
 
-    async def async_save(self) -> None:
-        """Save registry to storage."""
-        await self._store.async_save(self._registry)
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a debounced save of the registry to storage."""
+        # The store encodes with orjson, which serializes the entry dataclasses
+        # natively under their field names (the REG_* keys), so no per-entry
+        # dicts are built. The registry is replaced copy-on-write and its
+        # entries are frozen, so it can be handed over as is
+        self._store.async_delay_save(self._registry)
 
     async def async_shutdown(self) -> None:
         """Shutdown the engine cleanly."""
-        async with self._lock:
-            self._running = False
-            if self._task and not self._task.done():
-                self._task.cancel()
-                try:
-                    await self._task
-                except asyncio.CancelledError:
-                    pass
-            await self.async_save()
-            LOGGER.info("Dimmer engine shutdown complete")
+        self._running = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        # Flush immediately rather than waiting for the pending delayed save
+        await self._store.async_flush()
+        LOGGER.info("Dimmer engine shutdown complete")
 
     def _compute_phase_offset_for_brightness(
-        self, current_brightness: int, min_b: int, max_b: int, period: float
+        self, current_brightness: int, mid: float, amp: float
     ) -> float:
         """Compute phase offset so sine matches current brightness at t=0."""
-        mid = (min_b + max_b) / 2
-        amp = (max_b - min_b) / 2
-
         if amp == 0:
             return 0.0
 
@@ -245,91 +354,156 @@ class DimmerEngine:
         min_delta: int,
     ) -> None:
         """Start dimming for the specified lights."""
-        async with self._lock:
-            now = monotonic()
-            computed_offset: float | None = None
-
-            for i, entity_id in enumerate(lights):
-                # Determine phase offset based on mode
-                if phase_mode == PHASE_MODE_SYNC_TO_CURRENT:
-                    if sync_group and computed_offset is not None:
-                        # Reuse computed offset from first light
-                        offset = computed_offset
-                    else:
-                        # Compute offset from current brightness
-                        state = self.hass.states.get(entity_id)
-                        current_brightness = DEFAULT_MIN_BRIGHTNESS
-                        if state and state.attributes.get(ATTR_BRIGHTNESS):
-                            current_brightness = int(
-                                state.attributes.get(ATTR_BRIGHTNESS)
-                            )
+        now = monotonic()
+        computed_offset: float | None = None
+        # The range is fixed for the call, so lights that report the same
+        # value share an offset and asin only runs once per distinct value
+        mid = (min_brightness + max_brightness) / 2
+        amp = (max_brightness - min_brightness) / 2
+        offset_cache: dict[int, float] = {}
+
+        # Re-registering the light that holds the minimum tick may raise it,
+        # which needs a full rescan; otherwise the new tick is folded in
+        had_lights = bool(self._registry)
+        rescan_min_tick = any(
+            self._registry[entity_id].tick == self._min_tick
+            for entity_id in lights
+            if entity_id in self._registry
+        )
+
+        # Build a new registry and swap it in, so the loop never sees it change
+        registry = dict(self._registry)
+        for i, entity_id in enumerate(lights):
+            # Determine phase offset based on mode
+            if phase_mode == PHASE_MODE_SYNC_TO_CURRENT:
+                if sync_group and computed_offset is not None:
+                    # Reuse computed offset from first light
+                    offset = computed_offset
+                else:
+                    # Compute offset from current brightness
+                    state = self.hass.states.get(entity_id)
+                    current_brightness = DEFAULT_MIN_BRIGHTNESS
+                    if state and state.attributes.get(ATTR_BRIGHTNESS):
+                        current_brightness = int(
+                            state.attributes.get(ATTR_BRIGHTNESS)
+                        )
+                    offset = offset_cache.get(current_brightness)
+                    if offset is None:
                         offset = self._compute_phase_offset_for_brightness(
-                            current_brightness,
-                            min_brightness,
-                            max_brightness,
-                            period_s,
+                            current_brightness, mid, amp
                         )
-                        if sync_group and i == 0:
-                            computed_offset = offset
-                elif phase_mode == PHASE_MODE_ABSOLUTE:
-                    offset = phase_offset
-                else:  # PHASE_MODE_RELATIVE
-                    offset = phase_offset
-
-                self._registry[entity_id] = {
-                    REG_PERIOD: period_s,
-                    REG_TICK: tick_s,
-                    REG_MIN_B: min_brightness,
-                    REG_MAX_B: max_brightness,
-                    REG_PHASE_OFFSET: offset,
-                    REG_MIN_DELTA: min_delta,
-                    REG_STARTED_AT_TS: now,
-                    REG_PHASE_MODE: phase_mode,
-                    REG_SYNC_GROUP: sync_group,
-                }
-                LOGGER.info(
-                    "Started dimmer engine for %s: period=%.2fs, brightness=[%d,%d], "
-                    "phase_mode=%s, offset=%.4f",
-                    entity_id,
-                    period_s,
-                    min_brightness,
-                    max_brightness,
-                    phase_mode,
-                    offset,
-                )
+                        offset_cache[current_brightness] = offset
+                    if sync_group and i == 0:
+                        computed_offset = offset
+            elif phase_mode == PHASE_MODE_ABSOLUTE:
+                offset = phase_offset
+            else:  # PHASE_MODE_RELATIVE
+                offset = phase_offset
+
+            registry[entity_id] = DimmerEntry(
+                period=period_s,
+                tick=tick_s,
+                min_b=min_brightness,
+                max_b=max_brightness,
+                phase_offset=offset,
+                min_delta=min_delta,
+                started_at_ts=now + self._wall_offset,
+                phase_mode=phase_mode,
+                sync_group=sync_group,
+            )
+            LOGGER.info(
+                "Started dimmer engine for %s: period=%.2fs, brightness=[%d,%d], "
+                "phase_mode=%s, offset=%.4f",
+                entity_id,
+                period_s,
+                min_brightness,
+                max_brightness,
+                phase_mode,
+                offset,
+            )
 
-            await self.async_save()
-            self._ensure_loop_running()
+        self._registry = registry
+        if rescan_min_tick:
+            self._rescan_min_tick()
+        elif had_lights:
+            self._min_tick = min(self._min_tick, tick_s)
+        else:
+            self._min_tick = tick_s
+        self._rebuild_arrays()
+        self.async_schedule_save()
+        self._ensure_loop_running()
 
     async def async_stop(self, lights: list[str]) -> None:
         """Stop dimming for the specified lights."""
-        async with self._lock:
-            for entity_id in lights:
-                if entity_id in self._registry:
-                    del self._registry[entity_id]
-                    LOGGER.info("Stopped dimmer engine for %s", entity_id)
-                else:
-                    LOGGER.warning(
-                        "Light %s was not in dimmer engine registry", entity_id
-                    )
-
-            await self.async_save()
+        registry = dict(self._registry)
+        removed_ticks: list[float] = []
+        for entity_id in lights:
+            if entity_id in registry:
+                removed_ticks.append(registry.pop(entity_id).tick)
+                LOGGER.info("Stopped dimmer engine for %s", entity_id)
+            else:
+                LOGGER.warning(
+                    "Light %s was not in dimmer engine registry", entity_id
+                )
 
-            # Stop the loop immediately if registry is now empty
-            if not self._registry:
-                self._stop_loop()
+        self._registry = registry
+        # Only rescan if a light holding the minimum tick was removed
+        if self._min_tick in removed_ticks:
+            self._rescan_min_tick()
+        self._rebuild_arrays()
+        self.async_schedule_save()
+        # Stopping is an explicit commit point, so it is written out now
+        await self._store.async_flush()
+
+        # Stop the loop immediately if registry is now empty
+        if not self._registry:
+            self._stop_loop()
 
     async def async_stop_all(self) -> None:
         """Stop dimming for all lights."""
-        async with self._lock:
-            count = len(self._registry)
-            self._registry.clear()
-            await self.async_save()
-            LOGGER.info("Stopped dimmer engine for all %d lights", count)
-
-            # Stop the loop immediately
+        count = len(self._registry)
+        self._registry = {}
+        self._rebuild_arrays()
+        self.async_schedule_save()
+        await self._store.async_flush()
+        LOGGER.info("Stopped dimmer engine for all %d lights", count)
+
+        # Stop the loop immediately, unless lights were started during the
+        # flush
+        if not self._registry:
             self._stop_loop()
 
+    def _rescan_min_tick(self) -> None:
+        """Recompute the minimum tick interval from the whole registry."""
+        self._min_tick = min(
+            (entry.tick for entry in self._registry.values()),
+            default=DEFAULT_TICK_S,
+        )
+
+    def _rebuild_arrays(self) -> None:
+        """Rebuild the per-light arrays from the registry.
+
+        New lists are assigned rather than mutated in place, so a tick still
+        iterating the previous arrays is not affected.
+        """
+        entries = list(self._registry.values())
+        self._entity_ids = list(self._registry)
+        self._ticks = [entry.tick for entry in entries]
+        self._min_b = [entry.min_b for entry in entries]
+        self._max_b = [entry.max_b for entry in entries]
+        self._omegas = [(2 * math.pi) / entry.period for entry in entries]
+        self._mids = [(low + high) / 2 for low, high in zip(self._min_b, self._max_b)]
+        self._amps = [(high - low) / 2 for low, high in zip(self._min_b, self._max_b)]
+        self._phase_offsets = [entry.phase_offset for entry in entries]
+        self._min_deltas = [entry.min_delta for entry in entries]
+        self._started_at = [
+            entry.started_at_ts - self._wall_offset for entry in entries
+        ]
+        self._last_sent = [None] * len(entries)
+        self._resync_at = [0.0] * len(entries)
+        self._next_update = [0.0] * len(entries)
+        self._wakeup.set()
+
     def _stop_loop(self) -> None:
         """Stop the background loop task."""
         self._running = False
@@ -342,7 +516,7 @@ class DimmerEngine:
         return {
             "active_lights": len(self._registry),
             "loop_running": self._task is not None and not self._task.done(),
-            "registry": {k: dict(v) for k, v in self._registry.items()},
+            "registry": {k: v.as_dict() for k, v in self._registry.items()},
         }
 
     def is_cycle_dimming(self, entity_ids: list[str]) -> bool:
@@ -376,117 +550,175 @@ class DimmerEngine:
         """Main loop that updates all lights."""
         LOGGER.debug("Dimmer engine loop started")
 
-        while self._running:
-            # Collect registry snapshot and min tick while holding the lock
-            async with self._lock:
-                if not self._registry:
-                    LOGGER.debug("Registry empty, stopping loop")
-                    break
-
-                # Find the minimum tick interval
-                min_tick = min(
-                    entry[REG_TICK] for entry in self._registry.values()
-                )
-
-                # Take a snapshot of the registry to avoid holding lock during updates
-                registry_snapshot = {k: dict(v) for k, v in self._registry.items()}
+        # Bound once rather than resolved through hass on every light
+        states_get = self.hass.states.get
+        async_call = self.hass.services.async_call
 
-            # Get current time after releasing lock (monotonic for accurate timing)
+        while self._running:
+            # Cleared before the arrays are read, so only registry changes made
+            # after this point wake the next sleep early
+            self._wakeup.clear()
+
+            if not self._entity_ids:
+                LOGGER.debug("Registry empty, stopping loop")
+                break
+
+            min_tick = self._min_tick
+
+            # The arrays are replaced rather than mutated on registry changes,
+            # so these references stay consistent for the whole tick
+            entity_ids = self._entity_ids
+            ticks = self._ticks
+            min_deltas = self._min_deltas
+            phase_offsets = self._phase_offsets
+            started_at = self._started_at
+            omegas = self._omegas
+            mids = self._mids
+            amps = self._amps
+            lows = self._min_b
+            highs = self._max_b
+            last_sent = self._last_sent
+            resync_at = self._resync_at
+            next_update = self._next_update
+
+            # Checked once per tick so the per-light debug calls cost nothing
+            # when debug logging is off
+            debug = LOGGER.isEnabledFor(logging.DEBUG)
+
+            # Get current time (monotonic for accurate timing)
             now = monotonic()
 
-            # Build update coroutines for all lights and execute in parallel
-            update_tasks = [
-                self._update_light(entity_id, entry, now)
-                for entity_id, entry in registry_snapshot.items()
-            ]
-            if update_tasks:
-                results = await asyncio.gather(*update_tasks)
-                # Collect entities that need to be removed (missing entities)
-                entities_to_remove = [r for r in results if r is not None]
-
-                # Remove missing entities from registry while holding the lock
-                if entities_to_remove:
-                    async with self._lock:
-                        for entity_id in entities_to_remove:
-                            if self._registry.pop(entity_id, None) is not None:
-                                LOGGER.info("Removed missing entity %s from registry", entity_id)
-                        await self.async_save()
-
-            # Sleep for the minimum tick interval
-            await asyncio.sleep(min_tick)
-
-        LOGGER.debug("Dimmer engine loop ended")
+            # Only lights that are due are evaluated, in one pass over the arrays
+            due = [i for i, due_at in enumerate(next_update) if due_at <= now]
+            phases = _compute_phases(now, due, started_at, omegas, phase_offsets)
+            values = _compute_values(due, phases, mids, amps)
+            targets = _compute_targets(due, values, lows, highs)
+
+            # Group lights by (brightness, transition) so each group is sent
+            # as a single batched service call; the call data is built when a
+            # group gets its first light and the others are appended to it
+            call_data_by_target: dict[tuple[int, float], dict[str, Any]] = {}
+            entities_to_remove: list[str] = []
+            for i, phase, value, target in zip(due, phases, values, targets):
+                entity_id = entity_ids[i]
+                min_delta = min_deltas[i]
+
+                # Nothing would be sent while the target is within min_delta of
+                # the last known value, so only read the state once it has moved
+                # that far or the resync is due
+                last = last_sent[i]
+                if (
+                    last is None
+                    or abs(target - last) >= min_delta
+                    or now >= resync_at[i]
+                ):
+                    resync_at[i] = now + STATE_RESYNC_INTERVAL_S
+
+                    # Get current state
+                    state = states_get(entity_id)
+                    if state is None:
+                        LOGGER.warning(
+                            "Entity %s not found, will remove from registry", entity_id
+                        )
+                        entities_to_remove.append(entity_id)
+                        continue
+
+                    # Skip lights that are not currently on, polling them every
+                    # tick so they resume promptly once turned back on
+                    if state.state != STATE_ON:
+                        if debug:
+                            LOGGER.debug(
+                                "Skipping %s: light is not on (state=%s)",
+                                entity_id,
+                                state.state,
+                            )
+                        last_sent[i] = None
+                        next_update[i] = now + min_tick
+                        continue
+
+                    current_brightness = state.attributes.get(ATTR_BRIGHTNESS) or 0
+
+                    # Only update if delta is significant enough
+                    if abs(target - current_brightness) >= min_delta:
+                        if debug:
+                            LOGGER.debug(
+                                "Updating %s: brightness %d -> %d (phase=%.2f)",
+                                entity_id,
+                                current_brightness,
+                                target,
+                                phase,
+                            )
+                        # Use transition time (in seconds) equal to tick interval
+                        # for smooth dimming
+                        key = (target, ticks[i])
+                        call_data = call_data_by_target.get(key)
+                        if call_data is None:
+                            call_data = call_data_by_target[key] = {
+                                ATTR_ENTITY_ID: [],
+                                ATTR_BRIGHTNESS: target,
+                                ATTR_TRANSITION: ticks[i],
+                            }
+                        call_data[ATTR_ENTITY_ID].append(entity_id)
+                        last = target
+                    else:
+                        last = current_brightness
+                    last_sent[i] = last
+
+                # Schedule the next evaluation for when the target may have
+                # moved min_delta away from the last known value, which the
+                # rounded target reaches once the unrounded value is within
+                # half a unit of that distance. Deadlines advance from the
+                # previous one so processing time does not accumulate as drift,
+                # unless we are more than a tick behind (or the light was just
+                # registered), in which case we restart from now instead of
+                # bursting to catch up
+                step = (min_delta - 0.5 - abs(value - last)) / amps[i]
+                due_at = next_update[i]
+                if now - due_at > min_tick:
+                    due_at = now
+                next_update[i] = due_at + _compute_wait(
+                    phase, omegas[i], step, min_tick
+                )
 
-    async def _update_light(
-        self, entity_id: str, entry: dict[str, Any], now: float
-    ) -> str | None:
-        """Update a single light's brightness.
+            if len(call_data_by_target) == 1:
+                # Awaited directly, as gather would wrap a lone call in a task
+                (call_data,) = call_data_by_target.values()
+                await async_call("light", SERVICE_TURN_ON, call_data, blocking=False)
+            elif call_data_by_target:
+                await asyncio.gather(
+                    *(
+                        async_call("light", SERVICE_TURN_ON, call_data, blocking=False)
+                        for call_data in call_data_by_target.values()
+                    )
+                )
 
-        Returns the entity_id if the entity was not found and should be removed,
-        otherwise returns None.
-        """
-        period = entry[REG_PERIOD]
-        min_b = entry[REG_MIN_B]
-        max_b = entry[REG_MAX_B]
-        phase_offset = entry[REG_PHASE_OFFSET]
-        min_delta = entry[REG_MIN_DELTA]
-        started_at = entry[REG_STARTED_AT_TS]
-
-        # Calculate elapsed time
-        elapsed = now - started_at
-
-        # Calculate phase
-        time_phase = (2 * math.pi * elapsed) / period
-
-        # All phase modes use the same formula: phase = time_phase + offset
-        # The difference is how the offset was computed when the light was registered:
-        # - sync_to_current: offset computed from current brightness using asin
-        # - absolute: offset provided directly by user
-        # - relative: offset provided by user, added to time-based phase
-        phase = time_phase + phase_offset
-
-        # Calculate target brightness using sine wave
-        mid = (min_b + max_b) / 2
-        amp = (max_b - min_b) / 2
-        target = round(mid + amp * math.sin(phase))
-
-        # Clamp to valid range
-        target = max(min_b, min(max_b, target))
-
-        # Get current state
-        state = self.hass.states.get(entity_id)
-        if state is None:
-            LOGGER.warning("Entity %s not found, will remove from registry", entity_id)
-            return entity_id
-
-        # Skip lights that are not currently on
-        if state.state != STATE_ON:
-            LOGGER.debug("Skipping %s: light is not on (state=%s)", entity_id, state.state)
-            return None
-
-        current_brightness = state.attributes.get(ATTR_BRIGHTNESS, 0)
-        if current_brightness is None:
-            current_brightness = 0
-
-        # Only update if delta is significant enough
-        if abs(target - current_brightness) >= min_delta:
-            LOGGER.debug(
-                "Updating %s: brightness %d -> %d (phase=%.2f)",
-                entity_id,
-                current_brightness,
-                target,
-                phase,
-            )
-            # Use transition time (in seconds) equal to tick interval for smooth dimming
-            tick = entry[REG_TICK]
-            await self.hass.services.async_call(
-                "light",
-                SERVICE_TURN_ON,
-                {ATTR_ENTITY_ID: entity_id, ATTR_BRIGHTNESS: target, ATTR_TRANSITION: tick},
-                blocking=False,
-            )
+            # Remove missing entities from the registry
+            if entities_to_remove:
+                registry = dict(self._registry)
+                removed_ticks = []
+                for entity_id in entities_to_remove:
+                    entry = registry.pop(entity_id, None)
+                    if entry is not None:
+                        removed_ticks.append(entry.tick)
+                        LOGGER.info("Removed missing entity %s from registry", entity_id)
+                self._registry = registry
+                if self._min_tick in removed_ticks:
+                    self._rescan_min_tick()
+                self._rebuild_arrays()
+                self.async_schedule_save()
+
+            # Sleep until the earliest light is due; registry changes wake the
+            # loop early so newly started lights are picked up immediately
+            delay = min(self._next_update, default=0.0) - monotonic()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(delay):
+                        await self._wakeup.wait()
+            else:
+                # Always yield once per pass, even when a light is already due
+                await asyncio.sleep(0)
 
-        return None
+        LOGGER.debug("Dimmer engine loop ended")
 
 
 class CCWCycleEngine:
@@ -495,48 +727,98 @@ class CCWCycleEngine:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the CCW cycle engine."""
         self.hass = hass
-        self._registry: dict[str, dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
+        self._registry: dict[str, CCWCycleEntry] = {}
         self._task: asyncio.Task | None = None
         self._store = CCWCycleStore(hass)
         self._running = False
+        # Offset from the monotonic clock to the wall clock, captured once so
+        # persisted wall-clock start times map onto a stable monotonic base
+        self._wall_offset = time() - monotonic()
+
+        # Hot per-light fields kept as parallel arrays (structure of arrays) so
+        # a tick computes every target in one pass without dict lookups
+        self._entity_ids: list[str] = []
+        self._ticks: list[float] = []
+        self._min_ct: list[int] = []
+        self._max_ct: list[int] = []
+        # Per-light constants derived once at registration time: angular
+        # frequency (2*pi/period), sine midpoint and amplitude
+        self._omegas: list[float] = []
+        self._mids: list[float] = []
+        self._amps: list[float] = []
+        self._phase_offsets: list[float] = []
+        self._min_deltas: list[int] = []
+        self._started_at: list[float] = []
+        # Last value sent to (or read from) each light, and when its state is
+        # next re-read even if the target has not moved
+        self._last_sent: list[int | None] = []
+        self._resync_at: list[float] = []
+        # Time each light is next due to be evaluated
+        self._next_update: list[float] = []
+        # Set when the registry changes to wake the loop early
+        self._wakeup = asyncio.Event()
+        # Minimum tick interval across all registered lights
+        self._min_tick = DEFAULT_TICK_S
 
     async def async_load(self) -> None:
         """Load registry from storage and start loop if needed."""
-        async with self._lock:
-            self._registry = await self._store.async_load()
-            if self._registry:
-                LOGGER.info(
-                    "Restored %d lights from CCW storage: %s",
-                    len(self._registry),
-                    list(self._registry.keys()),
-                )
-                self._ensure_loop_running()
+        registry = await self._store.async_load()
+        # Entries saved before the period and tick were validated may have no
+        # angular frequency or keep the loop permanently due; drop them rather
+        # than failing setup or spinning
+        invalid = [
+            entity_id
+            for entity_id, entry in registry.items()
+            if entry.period <= 0 or entry.tick <= 0
+        ]
+        if invalid:
+            LOGGER.warning(
+                "Dropping lights with a non-positive period or tick from CCW "
+                "storage: %s",
+                invalid,
+            )
+            registry = {
+                entity_id: entry
+                for entity_id, entry in registry.items()
+                if entry.period > 0 and entry.tick > 0
+            }
+        self._registry = registry
+        self._rescan_min_tick()
+        self._rebuild_arrays()
+        if invalid:
+            self.async_schedule_save()
+        if self._registry:
+            LOGGER.info("Restored %d lights from CCW storage", len(self._registry))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Restored lights: %s", list(self._registry))
+            self._ensure_loop_running()
 
-    async def async_save(self) -> None:
-        """Save registry to storage."""
-        await self._store.async_save(self._registry)
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a debounced save of the registry to storage."""
+        # The store encodes with orjson, which serializes the entry dataclasses
+        # natively under their field names (the REG_* keys), so no per-entry
+        # dicts are built. The registry is replaced copy-on-write and its
+        # entries are frozen, so it can be handed over as is
+        self._store.async_delay_save(self._registry)
 
     async def async_shutdown(self) -> None:
         """Shutdown the engine cleanly."""
-        async with self._lock:
-            self._running = False
-            if self._task and not self._task.done():
-                self._task.cancel()
-                try:
-                    await self._task
-                except asyncio.CancelledError:
-                    pass
-            await self.async_save()
-            LOGGER.info("CCW cycle engine shutdown complete")
+        self._running = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        # Flush immediately rather than waiting for the pending delayed save
+        await self._store.async_flush()
+        LOGGER.info("CCW cycle engine shutdown complete")
 
     def _compute_phase_offset_for_color_temp(
-        self, current_ct: int, min_ct: int, max_ct: int, period: float
+        self, current_ct: int, mid: float, amp: float
     ) -> float:
         """Compute phase offset so sine matches current color temp at t=0."""
-        mid = (min_ct + max_ct) / 2
-        amp = (max_ct - min_ct) / 2
-
         if amp == 0:
             return 0.0
 
@@ -561,91 +843,156 @@ class CCWCycleEngine:
         min_delta: int,
     ) -> None:
         """Start CCW cycling for the specified lights."""
-        async with self._lock:
-            now = monotonic()
-            computed_offset: float | None = None
-
-            for i, entity_id in enumerate(lights):
-                # Determine phase offset based on mode
-                if phase_mode == PHASE_MODE_SYNC_TO_CURRENT:
-                    if sync_group and computed_offset is not None:
-                        # Reuse computed offset from first light
-                        offset = computed_offset
-                    else:
-                        # Compute offset from current color temperature
-                        state = self.hass.states.get(entity_id)
-                        current_ct = DEFAULT_MIN_COLOR_TEMP
-                        if state and state.attributes.get(ATTR_COLOR_TEMP_KELVIN):
-                            current_ct = int(
-                                state.attributes.get(ATTR_COLOR_TEMP_KELVIN)
-                            )
+        now = monotonic()
+        computed_offset: float | None = None
+        # The range is fixed for the call, so lights that report the same
+        # value share an offset and asin only runs once per distinct value
+        mid = (min_color_temp + max_color_temp) / 2
+        amp = (max_color_temp - min_color_temp) / 2
+        offset_cache: dict[int, float] = {}
+
+        # Re-registering the light that holds the minimum tick may raise it,
+        # which needs a full rescan; otherwise the new tick is folded in
+        had_lights = bool(self._registry)
+        rescan_min_tick = any(
+            self._registry[entity_id].tick == self._min_tick
+            for entity_id in lights
+            if entity_id in self._registry
+        )
+
+        # Build a new registry and swap it in, so the loop never sees it change
+        registry = dict(self._registry)
+        for i, entity_id in enumerate(lights):
+            # Determine phase offset based on mode
+            if phase_mode == PHASE_MODE_SYNC_TO_CURRENT:
+                if sync_group and computed_offset is not None:
+                    # Reuse computed offset from first light
+                    offset = computed_offset
+                else:
+                    # Compute offset from current color temperature
+                    state = self.hass.states.get(entity_id)
+                    current_ct = DEFAULT_MIN_COLOR_TEMP
+                    if state and state.attributes.get(ATTR_COLOR_TEMP_KELVIN):
+                        current_ct = int(
+                            state.attributes.get(ATTR_COLOR_TEMP_KELVIN)
+                        )
+                    offset = offset_cache.get(current_ct)
+                    if offset is None:
                         offset = self._compute_phase_offset_for_color_temp(
-                            current_ct,
-                            min_color_temp,
-                            max_color_temp,
-                            period_s,
+                            current_ct, mid, amp
                         )
-                        if sync_group and i == 0:
-                            computed_offset = offset
-                elif phase_mode == PHASE_MODE_ABSOLUTE:
-                    offset = phase_offset
-                else:  # PHASE_MODE_RELATIVE
-                    offset = phase_offset
-
-                self._registry[entity_id] = {
-                    REG_PERIOD: period_s,
-                    REG_TICK: tick_s,
-                    REG_MIN_CT: min_color_temp,
-                    REG_MAX_CT: max_color_temp,
-                    REG_PHASE_OFFSET: offset,
-                    REG_MIN_DELTA: min_delta,
-                    REG_STARTED_AT_TS: now,
-                    REG_PHASE_MODE: phase_mode,
-                    REG_SYNC_GROUP: sync_group,
-                }
-                LOGGER.info(
-                    "Started CCW cycle engine for %s: period=%.2fs, color_temp=[%d,%d], "
-                    "phase_mode=%s, offset=%.4f",
-                    entity_id,
-                    period_s,
-                    min_color_temp,
-                    max_color_temp,
-                    phase_mode,
-                    offset,
-                )
+                        offset_cache[current_ct] = offset
+                    if sync_group and i == 0:
+                        computed_offset = offset
+            elif phase_mode == PHASE_MODE_ABSOLUTE:
+                offset = phase_offset
+            else:  # PHASE_MODE_RELATIVE
+                offset = phase_offset
+
+            registry[entity_id] = CCWCycleEntry(
+                period=period_s,
+                tick=tick_s,
+                min_ct=min_color_temp,
+                max_ct=max_color_temp,
+                phase_offset=offset,
+                min_delta=min_delta,
+                started_at_ts=now + self._wall_offset,
+                phase_mode=phase_mode,
+                sync_group=sync_group,
+            )
+            LOGGER.info(
+                "Started CCW cycle engine for %s: period=%.2fs, color_temp=[%d,%d], "
+                "phase_mode=%s, offset=%.4f",
+                entity_id,
+                period_s,
+                min_color_temp,
+                max_color_temp,
+                phase_mode,
+                offset,
+            )
 
-            await self.async_save()
-            self._ensure_loop_running()
+        self._registry = registry
+        if rescan_min_tick:
+            self._rescan_min_tick()
+        elif had_lights:
+            self._min_tick = min(self._min_tick, tick_s)
+        else:
+            self._min_tick = tick_s
+        self._rebuild_arrays()
+        self.async_schedule_save()
+        self._ensure_loop_running()
 
     async def async_stop(self, lights: list[str]) -> None:
         """Stop CCW cycling for the specified lights."""
-        async with self._lock:
-            for entity_id in lights:
-                if entity_id in self._registry:
-                    del self._registry[entity_id]
-                    LOGGER.info("Stopped CCW cycle engine for %s", entity_id)
-                else:
-                    LOGGER.warning(
-                        "Light %s was not in CCW cycle engine registry", entity_id
-                    )
-
-            await self.async_save()
+        registry = dict(self._registry)
+        removed_ticks: list[float] = []
+        for entity_id in lights:
+            if entity_id in registry:
+                removed_ticks.append(registry.pop(entity_id).tick)
+                LOGGER.info("Stopped CCW cycle engine for %s", entity_id)
+            else:
+                LOGGER.warning(
+                    "Light %s was not in CCW cycle engine registry", entity_id
+                )
 
-            # Stop the loop immediately if registry is now empty
-            if not self._registry:
-                self._stop_loop()
+        self._registry = registry
+        # Only rescan if a light holding the minimum tick was removed
+        if self._min_tick in removed_ticks:
+            self._rescan_min_tick()
+        self._rebuild_arrays()
+        self.async_schedule_save()
+        # Stopping is an explicit commit point, so it is written out now
+        await self._store.async_flush()
+
+        # Stop the loop immediately if registry is now empty
+        if not self._registry:
+            self._stop_loop()
 
     async def async_stop_all(self) -> None:
         """Stop CCW cycling for all lights."""
-        async with self._lock:
-            count = len(self._registry)
-            self._registry.clear()
-            await self.async_save()
-            LOGGER.info("Stopped CCW cycle engine for all %d lights", count)
-
-            # Stop the loop immediately
+        count = len(self._registry)
+        self._registry = {}
+        self._rebuild_arrays()
+        self.async_schedule_save()
+        await self._store.async_flush()
+        LOGGER.info("Stopped CCW cycle engine for all %d lights", count)
+
+        # Stop the loop immediately, unless lights were started during the
+        # flush
+        if not self._registry:
             self._stop_loop()
 
+    def _rescan_min_tick(self) -> None:
+        """Recompute the minimum tick interval from the whole registry."""
+        self._min_tick = min(
+            (entry.tick for entry in self._registry.values()),
+            default=DEFAULT_TICK_S,
+        )
+
+    def _rebuild_arrays(self) -> None:
+        """Rebuild the per-light arrays from the registry.
+
+        New lists are assigned rather than mutated in place, so a tick still
+        iterating the previous arrays is not affected.
+        """
+        entries = list(self._registry.values())
+        self._entity_ids = list(self._registry)
+        self._ticks = [entry.tick for entry in entries]
+        self._min_ct = [entry.min_ct for entry in entries]
+        self._max_ct = [entry.max_ct for entry in entries]
+        self._omegas = [(2 * math.pi) / entry.period for entry in entries]
+        self._mids = [(low + high) / 2 for low, high in zip(self._min_ct, self._max_ct)]
+        self._amps = [(high - low) / 2 for low, high in zip(self._min_ct, self._max_ct)]
+        self._phase_offsets = [entry.phase_offset for entry in entries]
+        self._min_deltas = [entry.min_delta for entry in entries]
+        self._started_at = [
+            entry.started_at_ts - self._wall_offset for entry in entries
+        ]
+        self._last_sent = [None] * len(entries)
+        self._resync_at = [0.0] * len(entries)
+        self._next_update = [0.0] * len(entries)
+        self._wakeup.set()
+
     def _stop_loop(self) -> None:
         """Stop the background loop task."""
         self._running = False
@@ -658,7 +1005,7 @@ class CCWCycleEngine:
         return {
             "active_lights": len(self._registry),
             "loop_running": self._task is not None and not self._task.done(),
-            "registry": {k: dict(v) for k, v in self._registry.items()},
+            "registry": {k: v.as_dict() for k, v in self._registry.items()},
         }
 
     def is_ccw_cycling(self, entity_ids: list[str]) -> bool:
@@ -692,122 +1039,179 @@ class CCWCycleEngine:
         """Main loop that updates all lights."""
         LOGGER.debug("CCW cycle engine loop started")
 
-        while self._running:
-            # Collect registry snapshot and min tick while holding the lock
-            async with self._lock:
-                if not self._registry:
-                    LOGGER.debug("CCW registry empty, stopping loop")
-                    break
-
-                # Find the minimum tick interval
-                min_tick = min(
-                    entry[REG_TICK] for entry in self._registry.values()
-                )
-
-                # Take a snapshot of the registry to avoid holding lock during updates
-                registry_snapshot = {k: dict(v) for k, v in self._registry.items()}
+        # Bound once rather than resolved through hass on every light
+        states_get = self.hass.states.get
+        async_call = self.hass.services.async_call
 
-            # Get current time after releasing lock (monotonic for accurate timing)
+        while self._running:
+            # Cleared before the arrays are read, so only registry changes made
+            # after this point wake the next sleep early
+            self._wakeup.clear()
+
+            if not self._entity_ids:
+                LOGGER.debug("CCW registry empty, stopping loop")
+                break
+
+            min_tick = self._min_tick
+
+            # The arrays are replaced rather than mutated on registry changes,
+            # so these references stay consistent for the whole tick
+            entity_ids = self._entity_ids
+            ticks = self._ticks
+            min_deltas = self._min_deltas
+            phase_offsets = self._phase_offsets
+            started_at = self._started_at
+            omegas = self._omegas
+            mids = self._mids
+            amps = self._amps
+            lows = self._min_ct
+            highs = self._max_ct
+            last_sent = self._last_sent
+            resync_at = self._resync_at
+            next_update = self._next_update
+
+            # Checked once per tick so the per-light debug calls cost nothing
+            # when debug logging is off
+            debug = LOGGER.isEnabledFor(logging.DEBUG)
+
+            # Get current time (monotonic for accurate timing)
             now = monotonic()
 
-            # Build update coroutines for all lights and execute in parallel
-            update_tasks = [
-                self._update_light(entity_id, entry, now)
-                for entity_id, entry in registry_snapshot.items()
-            ]
-            if update_tasks:
-                results = await asyncio.gather(*update_tasks)
-                # Collect entities that need to be removed (missing entities)
-                entities_to_remove = [r for r in results if r is not None]
-
-                # Remove missing entities from registry while holding the lock
-                if entities_to_remove:
-                    async with self._lock:
-                        for entity_id in entities_to_remove:
-                            if self._registry.pop(entity_id, None) is not None:
-                                LOGGER.info(
-                                    "Removed missing entity %s from CCW registry",
-                                    entity_id,
-                                )
-                        await self.async_save()
-
-            # Sleep for the minimum tick interval
-            await asyncio.sleep(min_tick)
-
-        LOGGER.debug("CCW cycle engine loop ended")
-
-    async def _update_light(
-        self, entity_id: str, entry: dict[str, Any], now: float
-    ) -> str | None:
-        """Update a single light's color temperature.
-
-        Returns the entity_id if the entity was not found and should be removed,
-        otherwise returns None.
-        """
-        period = entry[REG_PERIOD]
-        min_ct = entry[REG_MIN_CT]
-        max_ct = entry[REG_MAX_CT]
-        phase_offset = entry[REG_PHASE_OFFSET]
-        min_delta = entry[REG_MIN_DELTA]
-        started_at = entry[REG_STARTED_AT_TS]
-
-        # Calculate elapsed time
-        elapsed = now - started_at
-
-        # Calculate phase
-        time_phase = (2 * math.pi * elapsed) / period
-
-        # All phase modes use the same formula: phase = time_phase + offset
-        phase = time_phase + phase_offset
-
-        # Calculate target color temperature using sine wave
-        mid = (min_ct + max_ct) / 2
-        amp = (max_ct - min_ct) / 2
-        target = round(mid + amp * math.sin(phase))
-
-        # Clamp to valid range
-        target = max(min_ct, min(max_ct, target))
-
-        # Get current state
-        state = self.hass.states.get(entity_id)
-        if state is None:
-            LOGGER.warning(
-                "Entity %s not found, will remove from CCW registry", entity_id
-            )
-            return entity_id
-
-        # Skip lights that are not currently on
-        if state.state != STATE_ON:
-            LOGGER.debug(
-                "Skipping %s: light is not on (state=%s)", entity_id, state.state
-            )
-            return None
+            # Only lights that are due are evaluated, in one pass over the arrays
+            due = [i for i, due_at in enumerate(next_update) if due_at <= now]
+            phases = _compute_phases(now, due, started_at, omegas, phase_offsets)
+            values = _compute_values(due, phases, mids, amps)
+            targets = _compute_targets(due, values, lows, highs)
+
+            # Group lights by (color temperature, transition) so each group is
+            # sent as a single batched service call; the call data is built when
+            # a group gets its first light and the others are appended to it
+            call_data_by_target: dict[tuple[int, float], dict[str, Any]] = {}
+            entities_to_remove: list[str] = []
+            for i, phase, value, target in zip(due, phases, values, targets):
+                entity_id = entity_ids[i]
+                min_delta = min_deltas[i]
+
+                # Nothing would be sent while the target is within min_delta of
+                # the last known value, so only read the state once it has moved
+                # that far or the resync is due
+                last = last_sent[i]
+                if (
+                    last is None
+                    or abs(target - last) >= min_delta
+                    or now >= resync_at[i]
+                ):
+                    resync_at[i] = now + STATE_RESYNC_INTERVAL_S
+
+                    # Get current state
+                    state = states_get(entity_id)
+                    if state is None:
+                        LOGGER.warning(
+                            "Entity %s not found, will remove from CCW registry",
+                            entity_id,
+                        )
+                        entities_to_remove.append(entity_id)
+                        continue
+
+                    # Skip lights that are not currently on, polling them every
+                    # tick so they resume promptly once turned back on
+                    if state.state != STATE_ON:
+                        if debug:
+                            LOGGER.debug(
+                                "Skipping %s: light is not on (state=%s)",
+                                entity_id,
+                                state.state,
+                            )
+                        last_sent[i] = None
+                        next_update[i] = now + min_tick
+                        continue
+
+                    current_ct = state.attributes.get(ATTR_COLOR_TEMP_KELVIN) or 0
+
+                    # Only update if delta is significant enough
+                    if abs(target - current_ct) >= min_delta:
+                        if debug:
+                            LOGGER.debug(
+                                "Updating %s: color_temp %d -> %d (phase=%.2f)",
+                                entity_id,
+                                current_ct,
+                                target,
+                                phase,
+                            )
+                        # Use transition time (in seconds) equal to tick interval
+                        # for smooth changes
+                        key = (target, ticks[i])
+                        call_data = call_data_by_target.get(key)
+                        if call_data is None:
+                            call_data = call_data_by_target[key] = {
+                                ATTR_ENTITY_ID: [],
+                                ATTR_COLOR_TEMP_KELVIN: target,
+                                ATTR_TRANSITION: ticks[i],
+                            }
+                        call_data[ATTR_ENTITY_ID].append(entity_id)
+                        last = target
+                    else:
+                        last = current_ct
+                    last_sent[i] = last
+
+                # Schedule the next evaluation for when the target may have
+                # moved min_delta away from the last known value, which the
+                # rounded target reaches once the unrounded value is within
+                # half a unit of that distance. Deadlines advance from the
+                # previous one so processing time does not accumulate as drift,
+                # unless we are more than a tick behind (or the light was just
+                # registered), in which case we restart from now instead of
+                # bursting to catch up
+                step = (min_delta - 0.5 - abs(value - last)) / amps[i]
+                due_at = next_update[i]
+                if now - due_at > min_tick:
+                    due_at = now
+                next_update[i] = due_at + _compute_wait(
+                    phase, omegas[i], step, min_tick
+                )
 
-        current_ct = state.attributes.get(ATTR_COLOR_TEMP_KELVIN) or 0
+            if len(call_data_by_target) == 1:
+                # Awaited directly, as gather would wrap a lone call in a task
+                (call_data,) = call_data_by_target.values()
+                await async_call("light", SERVICE_TURN_ON, call_data, blocking=False)
+            elif call_data_by_target:
+                await asyncio.gather(
+                    *(
+                        async_call("light", SERVICE_TURN_ON, call_data, blocking=False)
+                        for call_data in call_data_by_target.values()
+                    )
+                )
 
-        # Only update if delta is significant enough
-        if abs(target - current_ct) >= min_delta:
-            LOGGER.debug(
-                "Updating %s: color_temp %d -> %d (phase=%.2f)",
-                entity_id,
-                current_ct,
-                target,
-                phase,
-            )
-            # Use transition time (in seconds) equal to tick interval for smooth changes
-            tick = entry[REG_TICK]
-            await self.hass.services.async_call(
-                "light",
-                SERVICE_TURN_ON,
-                {
-                    ATTR_ENTITY_ID: entity_id,
-                    ATTR_COLOR_TEMP_KELVIN: target,
-                    ATTR_TRANSITION: tick,
-                },
-                blocking=False,
-            )
+            # Remove missing entities from the registry
+            if entities_to_remove:
+                registry = dict(self._registry)
+                removed_ticks = []
+                for entity_id in entities_to_remove:
+                    entry = registry.pop(entity_id, None)
+                    if entry is not None:
+                        removed_ticks.append(entry.tick)
+                        LOGGER.info(
+                            "Removed missing entity %s from CCW registry",
+                            entity_id,
+                        )
+                self._registry = registry
+                if self._min_tick in removed_ticks:
+                    self._rescan_min_tick()
+                self._rebuild_arrays()
+                self.async_schedule_save()
+
+            # Sleep until the earliest light is due; registry changes wake the
+            # loop early so newly started lights are picked up immediately
+            delay = min(self._next_update, default=0.0) - monotonic()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(delay):
+                        await self._wakeup.wait()
+            else:
+                # Always yield once per pass, even when a light is already due
+                await asyncio.sleep(0)
 
-        return None
+        LOGGER.debug("CCW cycle engine loop ended")
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
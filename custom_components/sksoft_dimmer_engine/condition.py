@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
@@ -27,11 +28,15 @@ _OPTIONS_SCHEMA_DICT: dict[vol.Marker, Any] = {
     vol.Required(ATTR_LIGHTS): cv.entity_ids,
 }
 
-_CONDITION_SCHEMA = vol.Schema(
-    {
-        vol.Required("options"): _OPTIONS_SCHEMA_DICT,
-    }
-)
+
+@cache
+def _condition_schema() -> vol.Schema:
+    """Return the condition schema, built the first time it is needed."""
+    return vol.Schema(
+        {
+            vol.Required("options"): _OPTIONS_SCHEMA_DICT,
+        }
+    )
 
 
 def is_cycle_dimming(hass: HomeAssistant, entity_ids: list[str]) -> bool:
@@ -100,7 +105,7 @@ class IsCycleDimmingCondition(Condition):
         cls, hass: HomeAssistant, config: ConfigType
     ) -> ConfigType:
         """Validate config."""
-        return cast(ConfigType, _CONDITION_SCHEMA(config))
+        return cast(ConfigType, _condition_schema()(config))
 
     def __init__(self, hass: HomeAssistant, config: ConditionConfig) -> None:
         """Initialize condition."""
@@ -130,7 +135,7 @@ class IsCCWCyclingCondition(Condition):
         cls, hass: HomeAssistant, config: ConfigType
     ) -> ConfigType:
         """Validate config."""
-        return cast(ConfigType, _CONDITION_SCHEMA(config))
+        return cast(ConfigType, _condition_schema()(config))
 
     def __init__(self, hass: HomeAssistant, config: ConditionConfig) -> None:
         """Initialize condition."""
@@ -11,9 +11,6 @@ from .const import DOMAIN
 
 LOGGER = logging.getLogger(__name__)
 
-# Log at module load time to help debug config flow issues
-LOGGER.debug("SKSoft Dimmer Engine config_flow module loaded, DOMAIN=%s", DOMAIN)
-
 
 class SKSoftDimmerEngineConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for SKSoft Dimmer Engine."""
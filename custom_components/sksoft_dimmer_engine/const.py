@@ -5,7 +5,9 @@ DOMAIN = "sksoft_dimmer_engine"
 # Storage
 STORAGE_KEY = "sksoft_dimmer_engine.registry"
 STORAGE_KEY_CCW = "sksoft_dimmer_engine.ccw_registry"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+# Delay used to coalesce registry writes into a single save
+STORAGE_SAVE_DELAY_S = 5.0
 
 # Service names
 SERVICE_START = "start"
@@ -28,6 +30,10 @@ DEFAULT_SYNC_GROUP = True
 DEFAULT_MIN_DELTA = 1
 DEFAULT_PHASE_MODE = "sync_to_current"
 
+# Longest a light goes without being re-evaluated and having its state re-read,
+# even while its target has not moved by min_delta, to pick up external changes
+STATE_RESYNC_INTERVAL_S = 4.0
+
 # CCW (Color Temperature) default values (in Kelvin)
 DEFAULT_MIN_COLOR_TEMP = 2700  # Warm white
 DEFAULT_MAX_COLOR_TEMP = 6500  # Cool white
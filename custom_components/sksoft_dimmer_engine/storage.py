@@ -3,11 +3,31 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass
+from functools import partial
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from homeassistant.core import callback
 from homeassistant.helpers.storage import Store
 
-from .const import STORAGE_KEY, STORAGE_KEY_CCW, STORAGE_VERSION
+from .const import (
+    REG_MAX_B,
+    REG_MAX_CT,
+    REG_MIN_B,
+    REG_MIN_CT,
+    REG_MIN_DELTA,
+    REG_PERIOD,
+    REG_PHASE_MODE,
+    REG_PHASE_OFFSET,
+    REG_STARTED_AT_TS,
+    REG_SYNC_GROUP,
+    REG_TICK,
+    STORAGE_KEY,
+    STORAGE_KEY_CCW,
+    STORAGE_SAVE_DELAY_S,
+    STORAGE_VERSION,
+)
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -15,51 +35,226 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
-class DimmerEngineStore:
-    """Class to manage persistent storage for the dimmer engine registry."""
+@dataclass(frozen=True, slots=True)
+class DimmerEntry:
+    """Registration of a light with the dimmer engine.
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    Entries are immutable; a restart replaces the entry rather than
+    modifying it. Per-tick state lives in the engine's arrays instead.
+    """
+
+    period: float
+    tick: float
+    min_b: int
+    max_b: int
+    phase_offset: float
+    min_delta: int
+    started_at_ts: float
+    phase_mode: str
+    sync_group: bool
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DimmerEntry:
+        """Create an entry from its stored form."""
+        return cls(
+            period=data[REG_PERIOD],
+            tick=data[REG_TICK],
+            min_b=data[REG_MIN_B],
+            max_b=data[REG_MAX_B],
+            phase_offset=data[REG_PHASE_OFFSET],
+            min_delta=data[REG_MIN_DELTA],
+            started_at_ts=data[REG_STARTED_AT_TS],
+            phase_mode=data[REG_PHASE_MODE],
+            sync_group=data[REG_SYNC_GROUP],
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored form of the entry."""
+        return {
+            REG_PERIOD: self.period,
+            REG_TICK: self.tick,
+            REG_MIN_B: self.min_b,
+            REG_MAX_B: self.max_b,
+            REG_PHASE_OFFSET: self.phase_offset,
+            REG_MIN_DELTA: self.min_delta,
+            REG_STARTED_AT_TS: self.started_at_ts,
+            REG_PHASE_MODE: self.phase_mode,
+            REG_SYNC_GROUP: self.sync_group,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CCWCycleEntry:
+    """Registration of a light with the CCW cycle engine.
+
+    Entries are immutable; a restart replaces the entry rather than
+    modifying it. Per-tick state lives in the engine's arrays instead.
+    """
+
+    period: float
+    tick: float
+    min_ct: int
+    max_ct: int
+    phase_offset: float
+    min_delta: int
+    started_at_ts: float
+    phase_mode: str
+    sync_group: bool
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CCWCycleEntry:
+        """Create an entry from its stored form."""
+        return cls(
+            period=data[REG_PERIOD],
+            tick=data[REG_TICK],
+            min_ct=data[REG_MIN_CT],
+            max_ct=data[REG_MAX_CT],
+            phase_offset=data[REG_PHASE_OFFSET],
+            min_delta=data[REG_MIN_DELTA],
+            started_at_ts=data[REG_STARTED_AT_TS],
+            phase_mode=data[REG_PHASE_MODE],
+            sync_group=data[REG_SYNC_GROUP],
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored form of the entry."""
+        return {
+            REG_PERIOD: self.period,
+            REG_TICK: self.tick,
+            REG_MIN_CT: self.min_ct,
+            REG_MAX_CT: self.max_ct,
+            REG_PHASE_OFFSET: self.phase_offset,
+            REG_MIN_DELTA: self.min_delta,
+            REG_STARTED_AT_TS: self.started_at_ts,
+            REG_PHASE_MODE: self.phase_mode,
+            REG_SYNC_GROUP: self.sync_group,
+        }
+
+
+_EntryT = TypeVar("_EntryT", DimmerEntry, CCWCycleEntry)
+
+
+class _RegistryStorage(Store[dict[str, Any]]):
+    """Store that migrates registries saved by older versions."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> dict[str, Any]:
+        """Migrate a stored registry to the current version."""
+        if old_major_version == 1:
+            # Version 1 stored start times as monotonic() readings. The
+            # monotonic clock is system-wide, so moving them onto the wall
+            # clock is exact as long as the machine has not rebooted since
+            offset = time() - monotonic()
+            return {
+                entity_id: {
+                    **entry,
+                    REG_STARTED_AT_TS: entry[REG_STARTED_AT_TS] + offset,
+                }
+                for entity_id, entry in old_data.items()
+            }
+        raise NotImplementedError
+
+
+class RegistryStore(Generic[_EntryT]):
+    """Class to manage persistent storage for an engine registry."""
+
+    def __init__(
+        self, hass: HomeAssistant, storage_key: str, entry_type: type[_EntryT]
+    ) -> None:
         """Initialize the storage."""
-        self._store: Store[dict[str, Any]] = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY
+        # Every write is a full, coalesced snapshot, so they are rare enough
+        # to afford writing atomically and never leave a torn file behind.
+        # The saved registry is never mutated, so it is safe to encode in the
+        # executor instead of on the event loop
+        self._store: Store[dict[str, Any]] = _RegistryStorage(
+            hass,
+            STORAGE_VERSION,
+            storage_key,
+            atomic_writes=True,
+            serialize_in_event_loop=False,
         )
+        self._hass = hass
+        self._entry_type = entry_type
+        # Registry as last loaded, written or scheduled to be written, kept by
+        # reference so loads are served from memory and saves that would not
+        # change the file are skipped; the engines never mutate a registry
+        # once it is saved
+        self._data: dict[str, _EntryT] | None = None
+        # Whether the scheduled delayed save has not been written yet
+        self._save_pending = False
 
-    async def async_load(self) -> dict[str, Any]:
-        """Load the registry from storage."""
-        data = await self._store.async_load()
-        if data is None:
-            return {}
-        return data
+    async def async_load(self) -> dict[str, _EntryT]:
+        """Load the registry from storage as typed entries."""
+        if self._data is None:
+            data = await self._store.async_load() or {}
+            self._data = {
+                entity_id: self._entry_type.from_dict(entry)
+                for entity_id, entry in data.items()
+            }
+        return self._data
 
-    async def async_save(self, data: dict[str, Any]) -> None:
+    async def async_save(self, data: dict[str, _EntryT]) -> None:
         """Save the registry to storage."""
+        if not self._save_pending and data == self._data:
+            return
+        self._data = data
+        self._save_pending = False
         await self._store.async_save(data)
 
+    @callback
+    def async_delay_save(self, data: dict[str, _EntryT]) -> None:
+        """Save the registry to storage after a delay, coalescing writes.
+
+        Every registry change schedules a new save, so the latest one always
+        carries the current registry, and Store only encodes it in the
+        executor.
+        """
+        if not self._save_pending and data == self._data:
+            return
+        self._data = data
+        self._save_pending = True
+        self._store.async_delay_save(
+            partial(self._delayed_save_data, data), STORAGE_SAVE_DELAY_S
+        )
+
+    def _delayed_save_data(self, data: dict[str, _EntryT]) -> dict[str, _EntryT]:
+        """Return the data of a delayed save as Store writes it.
+
+        Store may call this from the executor, so the pending flag is cleared
+        back on the event loop.
+        """
+        self._hass.loop.call_soon_threadsafe(self._async_delayed_save_written, data)
+        return data
+
+    @callback
+    def _async_delayed_save_written(self, data: dict[str, _EntryT]) -> None:
+        """Clear the pending flag unless a newer save has been scheduled."""
+        if self._data is data:
+            self._save_pending = False
+
+    async def async_flush(self) -> None:
+        """Write the pending delayed save now, if there is one."""
+        if self._save_pending and self._data is not None:
+            await self.async_save(self._data)
+
     async def async_remove(self) -> None:
         """Remove the storage file."""
+        self._data = None
         await self._store.async_remove()
 
 
-class CCWCycleStore:
-    """Class to manage persistent storage for the CCW (Correlated Color Temperature) cycle registry."""
+class DimmerEngineStore(RegistryStore[DimmerEntry]):
+    """Class to manage persistent storage for the dimmer engine registry."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the storage."""
-        self._store: Store[dict[str, Any]] = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY_CCW
-        )
+        super().__init__(hass, STORAGE_KEY, DimmerEntry)
 
-    async def async_load(self) -> dict[str, Any]:
-        """Load the registry from storage."""
-        data = await self._store.async_load()
-        if data is None:
-            return {}
-        return data
 
-    async def async_save(self, data: dict[str, Any]) -> None:
-        """Save the registry to storage."""
-        await self._store.async_save(data)
+class CCWCycleStore(RegistryStore[CCWCycleEntry]):
+    """Class to manage persistent storage for the CCW (Correlated Color Temperature) cycle registry."""
 
-    async def async_remove(self) -> None:
-        """Remove the storage file."""
-        await self._store.async_remove()
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the storage."""
+        super().__init__(hass, STORAGE_KEY_CCW, CCWCycleEntry)